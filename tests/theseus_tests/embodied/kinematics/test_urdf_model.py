@@ -89,6 +89,16 @@ def test_forward_kinematics_batched(dataset):
     )
 
 
+def test_forward_kinematics_matrix(dataset):
+    ee_name = dataset["ee_name"]
+    robot_model = th.eb.UrdfRobotModel(URDF_PATH, device=device, link_names=[ee_name])
+
+    ee_matrix = robot_model.forward_kinematics_matrix(dataset["joint_states"])[ee_name]
+    ee_se3 = robot_model.forward_kinematics(dataset["joint_states"])[ee_name]
+
+    assert torch.allclose(ee_matrix, ee_se3.tensor)
+
+
 @pytest.fixture
 def autograd_jacobians(dataset):
     ee_name = dataset["ee_name"]
@@ -3,13 +3,16 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import numpy as np
 import pytest  # noqa: F401
 import torch
+from scipy.sparse import csc_matrix, csr_matrix
 
 from tests.theseus_tests.decorators import run_if_baspacho
 from tests.theseus_tests.optimizer.autograd.test_baspacho_sparse_backward import (
     get_linearization_and_solver_for_random_sparse,
 )
+from theseus.optimizer.linear.baspacho_sparse_solver import _build_block_ata_pattern
 
 
 def check_sparse_solver(
@@ -90,3 +93,45 @@ def test_baspacho_solver_cuda(
         fill=fill,
         dev="cuda",
     )
+
+
+# This one is pure NumPy, so it doesn't need the baspacho extension. The
+# reference is the sparse-product construction the pattern builder replaced:
+# pool A's columns to block-rows, then take the pattern of block_At @ block_At.T
+def test_build_block_ata_pattern():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        num_vars = int(rng.integers(1, 12))
+        var_dims = rng.integers(1, 5, num_vars)
+        num_cols = int(var_dims.sum())
+        num_rows = int(rng.integers(1, 20))
+        col_ind_list = []
+        row_ptr = [0]
+        for _ in range(num_rows):
+            # rows may be empty and their column indices unsorted
+            cols = rng.permutation(num_cols)[: int(rng.integers(0, num_cols + 1))]
+            col_ind_list.extend(cols)
+            row_ptr.append(len(col_ind_list))
+        col_ind = np.array(col_ind_list, dtype=np.int64)
+        var_of_col = np.repeat(np.arange(num_vars), var_dims)
+
+        At_mock = csc_matrix(
+            (np.ones(len(col_ind)), col_ind, row_ptr), (num_cols, num_rows)
+        )
+        to_blocks = csr_matrix(
+            (
+                np.ones(num_cols),
+                np.arange(num_cols),
+                np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(var_dims))),
+            ),
+            (num_vars, num_cols),
+        )
+        block_At_mock = to_blocks @ At_mock
+        expected = (block_At_mock @ block_At_mock.T).tocsr()
+        expected.sort_indices()
+
+        block_ptrs, block_inds = _build_block_ata_pattern(
+            np.array(row_ptr, dtype=np.int64), col_ind, var_of_col, num_vars
+        )
+        np.testing.assert_array_equal(block_ptrs, expected.indptr)
+        np.testing.assert_array_equal(block_inds, expected.indices)
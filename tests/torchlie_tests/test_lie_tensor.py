@@ -84,9 +84,14 @@ def test_op(op_name, ltype_str, batch_size, rng):
         lie_tensor_inputs = _get_lie_tensor_inputs(input_types, inputs, ltype)
         fn_holder_object = ltype if hasattr(ltype, op_name) else lie
         out = _to_functional_fmt(getattr(fn_holder_object, op_name)(*lie_tensor_inputs))
-        impl_out = getattr(impl_module, f"_{impl_name}_autograd_fn")(*inputs)
+        impl_fn = getattr(impl_module, f"_{impl_name}_autograd_fn")
+        impl_out = impl_fn(*inputs)
         torch.testing.assert_close(out, impl_out)
 
+        # The op's native batching should agree with vmap of the
+        # implementation over the batch dimension
+        torch.testing.assert_close(impl_out, torch.vmap(impl_fn)(*inputs))
+
         # Also check that class-version is correct
         if hasattr(ltype, op_name):
             continue  # No class version for things like exp, hat, vee, etc.
@@ -40,7 +40,7 @@ class IdentityModel(KinematicsModel):
     def forward_kinematics(  # type: ignore
         self, robot_pose: RobotModelInput
     ) -> Dict[str, LieGroup]:
-        if isinstance(robot_pose, Point2) or isinstance(robot_pose, Vector):
+        if isinstance(robot_pose, (Point2, Vector)):
             assert robot_pose.dof() == 2
             return {"state": robot_pose}
         raise NotImplementedError(
@@ -60,7 +60,51 @@ class UrdfRobotModel(KinematicsModel):
         self.fk, self.jfk_b, self.jfk_s = get_forward_kinematics_fns(
             self.robot, link_names
         )
-        self.link_names = link_names
+        # Resolve the selected link names once, so that `forward_kinematics` only
+        # needs to zip them with the poses computed by the (single-pass) FK
+        # functions. If no names are given, the FK functions operate on all links,
+        # in the same order as `self.robot.get_links()`.
+        self.link_names: List[str] = (
+            link_names
+            if link_names is not None
+            else [link.name for link in self.robot.get_links()]
+        )
+        self._dof: int = self.robot.dof
+
+    def _parse_joint_states(self, joint_states: RobotModelInput) -> torch.Tensor:
+        # Check input dimensions
+        if joint_states.shape[-1] != self._dof:
+            raise ValueError(
+                f"Robot model dofs ({self._dof}) incompatible with "
+                f"input joint state dimensions ({joint_states.shape[-1]})."
+            )
+
+        # Parse input. Duck-typing (torch.Tensor, or anything wrapping its
+        # data in a `tensor` attribute, like th.Vector) avoids isinstance
+        # dispatch on every call of the optimizer's inner loop.
+        joint_states_input = getattr(joint_states, "tensor", joint_states)
+        if not isinstance(joint_states_input, torch.Tensor):
+            raise Exception(
+                "Invalid input joint states data type. "
+                "Valid types are torch.Tensor and th.Vector."
+            )
+        return joint_states_input
+
+    def forward_kinematics_matrix(
+        self, joint_states: RobotModelInput
+    ) -> Dict[str, torch.Tensor]:
+        """Computes forward kinematics, returning raw pose matrices.
+
+        Args:
+            joint_states (tensor or theseus.Vector): Vector of all joint angles
+        Outputs:
+            Dictionary that maps link name to a [batch_size, 3, 4] pose matrix.
+            Unlike `forward_kinematics`, the poses are not wrapped in SE3
+            objects, which avoids one object construction per link when only
+            the matrices are needed.
+        """
+        poses_list = self.fk(self._parse_joint_states(joint_states))
+        return dict(zip(self.link_names, poses_list))
 
     def forward_kinematics(  # type: ignore
         self,
@@ -82,23 +126,7 @@ class UrdfRobotModel(KinematicsModel):
         if jacobians is not None and len(jacobians) > 0:
             raise ValueError("Jacobians dictionary must be empty on input.")
 
-        # Check input dimensions
-        if joint_states.shape[-1] != self.robot.dof:
-            raise ValueError(
-                f"Robot model dofs ({self.robot.dof}) incompatible with "
-                f"input joint state dimensions ({joint_states.shape[-1]})."
-            )
-
-        # Parse input
-        if isinstance(joint_states, torch.Tensor):
-            joint_states_input = joint_states
-        elif isinstance(joint_states, Vector):
-            joint_states_input = joint_states.tensor
-        else:
-            raise Exception(
-                "Invalid input joint states data type. "
-                "Valid types are torch.Tensor and th.Vector."
-            )
+        joint_states_input = self._parse_joint_states(joint_states)
 
         # Compute jacobians
         poses_list = []
@@ -120,8 +148,11 @@ class UrdfRobotModel(KinematicsModel):
         # Do forward kinematics for all links (if not done by jacobians function)
         poses_list = poses_list or self.fk(joint_states_input)
 
+        # The poses returned by the FK functions are compositions of valid SE3
+        # matrices, so they are valid by construction and the (potentially
+        # expensive) per-link group checks can be safely skipped.
         link_poses = {}
         for i, name in enumerate(self.link_names):
-            link_poses[name] = SE3(tensor=poses_list[i], strict_checks=False)
+            link_poses[name] = SE3(tensor=poses_list[i], disable_checks=True)
 
         return link_poses
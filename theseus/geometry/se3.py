@@ -129,14 +129,18 @@ class SE3(LieGroup):
         if x_y_z_quaternion.ndim == 1:
             x_y_z_quaternion = x_y_z_quaternion.unsqueeze(0)
 
-        if x_y_z_quaternion.ndim != 2 and x_y_z_quaternion.shape[1] != 7:
+        if x_y_z_quaternion.ndim != 2 or x_y_z_quaternion.shape[1] != 7:
             raise ValueError("x_y_z_quaternion can only be 7-D vectors.")
 
         ret = SE3()
 
         batch_size = x_y_z_quaternion.shape[0]
-        ret.tensor = torch.empty(batch_size, 3, 4).to(
-            device=x_y_z_quaternion.device, dtype=x_y_z_quaternion.dtype
+        ret.tensor = torch.empty(
+            batch_size,
+            3,
+            4,
+            device=x_y_z_quaternion.device,
+            dtype=x_y_z_quaternion.dtype,
         )
         ret[:, :, :3] = SO3.unit_quaternion_to_SO3(x_y_z_quaternion[:, 3:]).tensor
         ret[:, :, 3] = x_y_z_quaternion[:, :3]
@@ -7,7 +7,6 @@ from typing import Any, Dict, Optional, Type, Union
 
 import numpy as np
 import torch
-from scipy.sparse import csr_matrix
 
 from theseus.core import Objective
 from theseus.optimizer import Linearization, SparseLinearization
@@ -20,6 +19,36 @@ from .utils import convert_to_alpha_beta_damping_tensors
 DEFAULT_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
 
+# Computes the CSR pattern (indptr, indices) of the block-structure of AtA:
+# entry (i, j) is present iff variables i and j are touched by a common row of
+# A. Each row of A contributes the cartesian product of the (deduplicated)
+# variables it touches, and np.unique merges the pairs across rows. Everything
+# is a vectorized pass over the nonzeros, and since np.unique sorts, the
+# resulting pattern is ordered by construction.
+def _build_block_ata_pattern(
+    row_ptr: np.ndarray, col_ind: np.ndarray, var_of_col: np.ndarray, num_vars: int
+):
+    num_rows = len(row_ptr) - 1
+    row_of_nz = np.repeat(np.arange(num_rows), np.diff(row_ptr))
+    row_var_codes = np.unique(row_of_nz * num_vars + var_of_col[col_ind])
+    vars_of_row = row_var_codes % num_vars
+    counts = np.bincount(row_var_codes // num_vars, minlength=num_rows)
+    # for a row touching k variables, emit all k * k (var_i, var_j) pairs
+    pair_counts = counts**2
+    left = np.repeat(vars_of_row, np.repeat(counts, counts))
+    zero = np.zeros(1, dtype=np.int64)
+    group_starts = np.concatenate((zero, np.cumsum(counts)[:-1]))
+    pair_starts = np.concatenate((zero, np.cumsum(pair_counts)[:-1]))
+    within = np.arange(pair_counts.sum()) - np.repeat(pair_starts, pair_counts)
+    right = vars_of_row[
+        np.repeat(group_starts, pair_counts) + within % np.repeat(counts, pair_counts)
+    ]
+    pattern = np.unique(left * num_vars + right)
+    block_ptrs = np.zeros(num_vars + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pattern // num_vars, minlength=num_vars), out=block_ptrs[1:])
+    return block_ptrs, pattern % num_vars
+
+
 class BaspachoSparseSolver(LinearSolver):
     def __init__(
         self,
@@ -78,36 +107,44 @@ class BaspachoSparseSolver(LinearSolver):
                 f"{type(e).__name__}: {e}"
             )
 
-        # convert to tensors for accelerated Mt x M operation
-        self.A_row_ptr = torch.tensor(
-            self.linearization.structure().row_ptr, dtype=torch.int64
-        ).to(dev)
-        self.A_col_ind = torch.tensor(
-            self.linearization.structure().col_ind, dtype=torch.int64
-        ).to(dev)
-
-        # compute block-structure of AtA. To do so we multiply the Jacobian's
-        # transpose At by a matrix that collapses the rows to block-rows, ie
-        # if i-th block starts at b_i, then a non-zero in b_i-th row becomes
-        # a non-zero in i-th row.
-        At_mock = self.linearization.structure().mock_csc_transpose()
+        # the symbolic structure is invariant between calls to reset(), so
+        # compute it once and reuse it below and in solve()
+        self._structure = self.linearization.structure()
+
+        # convert to tensors for accelerated Mt x M operation. from_numpy
+        # wraps the arrays without copying, unlike torch.tensor which walks
+        # them element by element
+        A_row_ptr = torch.from_numpy(
+            np.asarray(self._structure.row_ptr, dtype=np.int64)
+        )
+        A_col_ind = torch.from_numpy(
+            np.asarray(self._structure.col_ind, dtype=np.int64)
+        )
+        if "cuda" in dev:
+            # stage through pinned memory so the two host-to-device copies are
+            # issued asynchronously and can overlap, instead of synchronizing
+            # on each .to(dev)
+            self.A_row_ptr = A_row_ptr.pin_memory().to(dev, non_blocking=True)
+            self.A_col_ind = A_col_ind.pin_memory().to(dev, non_blocking=True)
+        else:
+            self.A_row_ptr = A_row_ptr
+            self.A_col_ind = A_col_ind
+
+        # compute block-structure of AtA. Column j of A belongs to the j-th
+        # variable's block-row, so the pattern can be assembled directly from
+        # A's column indices remapped to variable indices, without going
+        # through a sparse matrix product.
         num_vars = len(self.linearization.var_start_cols)
-        num_cols = self.linearization.num_cols
-        to_blocks = csr_matrix(
-            (
-                np.ones(num_cols),
-                np.arange(num_cols),
-                [*self.linearization.var_start_cols, num_cols],
-            ),
-            (num_vars, num_cols),
+        var_of_col = np.repeat(np.arange(num_vars), self.linearization.var_dims)
+        block_ptrs, block_inds = _build_block_ata_pattern(
+            self._structure.row_ptr, self._structure.col_ind, var_of_col, num_vars
         )
-        block_At_mock = to_blocks @ At_mock
-        block_AtA_mock = (block_At_mock @ block_At_mock.T).tocsr()
-        block_AtA_mock.sort_indices()
 
-        param_size = torch.tensor(self.linearization.var_dims, dtype=torch.int64)
-        block_struct_ptrs = torch.tensor(block_AtA_mock.indptr, dtype=torch.int64)
-        block_struct_inds = torch.tensor(block_AtA_mock.indices, dtype=torch.int64)
+        param_size = torch.from_numpy(
+            np.asarray(self.linearization.var_dims, dtype=np.int64)
+        )
+        block_struct_ptrs = torch.from_numpy(block_ptrs)
+        block_struct_inds = torch.from_numpy(block_inds)
         self.symbolic_decomposition = SymbolicDecomposition(
             param_size, block_struct_ptrs, block_struct_inds, dev
         )
@@ -139,7 +176,7 @@ class BaspachoSparseSolver(LinearSolver):
         return BaspachoSolveFunction.apply(
             self.linearization.A_val,
             self.linearization.b,
-            self.linearization.structure(),
+            self._structure,
             self.A_row_ptr,
             self.A_col_ind,
             self.symbolic_decomposition,
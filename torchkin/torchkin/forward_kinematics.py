@@ -33,10 +33,12 @@ def ForwardKinematicsFactory(robot: Robot, link_names: Optional[List[str]] = Non
             )
 
         poses: List[Optional[torch.Tensor]] = [None] * robot.num_links
-        poses[0] = angles.new_zeros(angles.shape[0], 3, 4)
-        poses[0][:, 0, 0] = 1
-        poses[0][:, 1, 1] = 1
-        poses[0][:, 2, 2] = 1
+        # a broadcast add of the identity instead of three separate diagonal
+        # writes; new_zeros keeps the batch lineage of `angles` so this also
+        # works under vmap
+        poses[0] = angles.new_zeros(angles.shape[0], 3, 4) + torch.eye(
+            3, 4, dtype=angles.dtype, device=angles.device
+        )
 
         for id in related_link_ids[1:]:
             curr: Link = robot.links[id]
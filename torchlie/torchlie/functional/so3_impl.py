@@ -821,7 +821,10 @@ _juntransform_autograd_fn = _juntransform_impl
 def _quaternion_to_rotation_impl(quaternion: torch.Tensor) -> torch.Tensor:
     check_unit_quaternion(quaternion)
 
-    quaternion = quaternion / torch.norm(quaternion, dim=-1, keepdim=True)
+    # F.normalize fuses the norm and the division into a single kernel,
+    # while `quaternion / torch.norm(...)` launches two and materializes
+    # the intermediate norm tensor.
+    quaternion = torch.nn.functional.normalize(quaternion, dim=-1)
     w = quaternion[..., 0]
     x = quaternion[..., 1]
     y = quaternion[..., 2]
@@ -839,16 +842,22 @@ def _quaternion_to_rotation_impl(quaternion: torch.Tensor) -> torch.Tensor:
     q33 = z * z
 
     size = quaternion.shape[:-1]
-    ret = quaternion.new_zeros(*size, 3, 3)
-    ret[..., 0, 0] = q00 + q11 - q22 - q33
-    ret[..., 0, 1] = 2 * (q12 - q03)
-    ret[..., 0, 2] = 2 * (q13 + q02)
-    ret[..., 1, 0] = 2 * (q12 + q03)
-    ret[..., 1, 1] = q00 - q11 + q22 - q33
-    ret[..., 1, 2] = 2 * (q23 - q01)
-    ret[..., 2, 0] = 2 * (q13 - q02)
-    ret[..., 2, 1] = 2 * (q23 + q01)
-    ret[..., 2, 2] = q00 - q11 - q22 + q33
+    # assembling with a single stack avoids the zero-fill and the nine
+    # separate slice-write kernels of the index-assignment form
+    ret = torch.stack(
+        (
+            q00 + q11 - q22 - q33,
+            2 * (q12 - q03),
+            2 * (q13 + q02),
+            2 * (q12 + q03),
+            q00 - q11 + q22 - q33,
+            2 * (q23 - q01),
+            2 * (q13 - q02),
+            2 * (q23 + q01),
+            q00 - q11 - q22 + q33,
+        ),
+        dim=-1,
+    ).reshape(*size, 3, 3)
     return ret
 
 